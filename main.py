@@ -15,65 +15,173 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
-import json
+import functools
 import os
+import random
 import logging
-import aiohttp
+import orjson
 import websockets
 import uuid
 import re
+import signal
 import socket
-import ipaddress  # Neu für Broadcast-Berechnung
-from aiohttp import web
+import struct
+import urllib.error
+import urllib.parse
+import urllib.request
+from http import HTTPStatus
 from pyartnet import ArtNetNode
 
+try:
+    # uvloop gibt es nicht für Windows -> dort Standard-Loop (Setup-Modus)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # Optional (Extra "netmask"): echte Netzmaske des Interfaces statt /24-Annahme
+    import psutil
+except ImportError:
+    psutil = None
+
 # Konfiguration
 CONFIG_FILE = "node_config.json"
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("Hyperion-Node")
 
+# ArtNet Ausgabe
+ARTNET_MAX_FPS = 30
+# Gültige ArtNet Port-Adressen (15 Bit)
+ARTNET_MAX_UNIVERSE = 32767
+
+# Reconnect-Backoff (Sekunden)
+RECONNECT_MIN_DELAY = 0.2
+RECONNECT_MAX_DELAY = 30.0
+
+# Universum-ID im Frame-Header: 2 Bytes, Big Endian
+_U16 = struct.Struct(">H")
+# Nullen zum Auffüllen kurzer Frames (memoryview: Slicing ohne Kopie)
+_ZEROS = memoryview(bytes(512))
+# IPv4-Adresse als Integer (Network Byte Order)
+_U32 = struct.Struct("!I")
+
 
+@functools.lru_cache(maxsize=1)
 def get_mac_address():
     """Ermittelt die MAC-Adresse des Geräts."""
     mac = ':'.join(re.findall('..', '%012x' % uuid.getnode()))
     return mac
 
 
+_local_ip = None
+
+
 def get_local_ip():
-    """Ermittelt die eigene IP-Adresse."""
+    """
+    Ermittelt die eigene IP-Adresse.
+    Erst per UDP-Connect-Trick, sonst über die Adressen des Hostnamens.
+    Das Ergebnis wird gecacht, der Fallback 127.0.0.1 aber nicht,
+    damit eine später verfügbare Netzwerkverbindung noch erkannt wird.
+    """
+    global _local_ip
+    if _local_ip is not None:
+        return _local_ip
+
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
         s.connect(('10.255.255.255', 1))
-        IP = s.getsockname()[0]
+        _local_ip = s.getsockname()[0]
+        return _local_ip
     except Exception:
-        IP = '127.0.0.1'
+        pass
     finally:
         s.close()
-    return IP
 
+    # Fallback für abgeschottete Netze ohne Route
+    try:
+        for *_, sockaddr in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            if not sockaddr[0].startswith("127."):
+                _local_ip = sockaddr[0]
+                return _local_ip
+    except Exception:
+        pass
+
+    return '127.0.0.1'
 
+
+def get_netmask(ip):
+    """
+    Liefert die Netzmaske des Interfaces mit der Adresse ip.
+    Braucht psutil (Extra "netmask": uv sync --extra netmask).
+    Ohne psutil (oder wenn nichts passt) wird eine /24 Maske angenommen.
+    """
+    if psutil is not None:
+        try:
+            for addrs in psutil.net_if_addrs().values():
+                for addr in addrs:
+                    if addr.family == socket.AF_INET and addr.address == ip and addr.netmask:
+                        return addr.netmask
+        except Exception:
+            pass
+    return "255.255.255.0"
+
+
+@functools.lru_cache(maxsize=8)
 def get_subnet_broadcast(ip):
     """
-    Berechnet die Broadcast-Adresse für das lokale Subnetz.
-    Nimmt vereinfacht eine /24 Maske (255.255.255.0) an, was für Heimnetze Standard ist.
-    Macht aus '192.168.178.50' -> '192.168.178.255'.
+    Berechnet die Broadcast-Adresse für das lokale Subnetz per Bit-Arithmetik.
+    Macht bei /24 aus '192.168.178.50' -> '192.168.178.255'.
     """
     try:
-        # Erstellt ein Netzwerk-Objekt mit /24 Maske
-        net = ipaddress.IPv4Network(f"{ip}/24", strict=False)
-        return str(net.broadcast_address)
+        ip_int = _U32.unpack(socket.inet_aton(ip))[0]
+        mask_int = _U32.unpack(socket.inet_aton(get_netmask(ip)))[0]
+        return socket.inet_ntoa(_U32.pack(ip_int | (~mask_int & 0xFFFFFFFF)))
     except Exception:
         return "255.255.255.255"
 
 
+def parse_universes(text):
+    """
+    Parst eine kommagetrennte Liste von Universen, z.B. '0,1,2'.
+    Doppelte Einträge werden entfernt, ungültige werfen ValueError.
+    """
+    universe_ids = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        u_id = int(part)
+        if not 0 <= u_id <= ARTNET_MAX_UNIVERSE:
+            raise ValueError(f"Universum {u_id} liegt nicht in 0..{ARTNET_MAX_UNIVERSE}")
+        if u_id not in universe_ids:
+            universe_ids.append(u_id)
+    return universe_ids
+
+
+def save_config(config):
+    """
+    Schreibt die Konfiguration atomar: erst in eine Temp-Datei, dann per os.replace.
+    Ein Absturz mitten im Schreiben hinterlässt so nie eine halbe JSON-Datei.
+    """
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(config))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+
+
 # --- TEIL 1: SETUP SERVER ---
+# Minimaler HTTP-Server auf Basis von asyncio.start_server. Der Setup-Modus läuft
+# nur einmal, dafür lohnt sich kein aiohttp (Speicher + Importzeit auf dem Pi).
 
-async def handle_setup_page(request):
-    my_mac = get_mac_address()
-    my_ip = get_local_ip()
+SETUP_MAX_BODY = 64 * 1024
+SETUP_MAX_HEADERS = 100
+SETUP_READ_TIMEOUT = 10
+REGISTER_TIMEOUT = 10
 
-    html = f"""
+_SETUP_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -88,7 +196,7 @@ async def handle_setup_page(request):
     </head>
     <body>
         <h1>🔌 Node Enrollment</h1>
-        <div class="info">Device MAC: {my_mac} | IP: {my_ip}</div>
+        <div class="info">Device MAC: {mac} | IP: {ip}</div>
         
         <form action="/register" method="post">
             <label>Hyperion Server URL</label>
@@ -100,6 +208,9 @@ async def handle_setup_page(request):
             <label>ArtNet Target IP (Lass 255.255.255.255 für Auto-Broadcast)</label>
             <input type="text" name="artnet_ip" value="255.255.255.255" required>
 
+            <label>Universen (optional, z.B. 0,1,2)</label>
+            <input type="text" name="universes" placeholder="0,1,2">
+
             <label>OTP Code</label>
             <input type="text" name="otp" placeholder="XY1234" required style="text-transform: uppercase; letter-spacing: 5px; font-family: monospace;">
             
@@ -108,74 +219,270 @@ async def handle_setup_page(request):
     </body>
     </html>
     """
-    return web.Response(text=html, content_type='text/html')
 
 
-async def handle_register(request):
-    data = await request.post()
-    server_base = data.get('host').rstrip("/")
-    node_name = data.get('name')
-    otp_code = data.get('otp').upper()
-    artnet_ip = data.get('artnet_ip')
+def handle_setup_page():
+    return _SETUP_HTML.format(mac=get_mac_address(), ip=get_local_ip())
+
+
+def post_json(url, payload):
+    """Blockierender JSON-POST, läuft per asyncio.to_thread. Gibt (Status, Body) zurück."""
+    req = urllib.request.Request(url,
+                                 data=orjson.dumps(payload),
+                                 headers={"Content-Type": "application/json"},
+                                 method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=REGISTER_TIMEOUT) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+async def handle_register(form, setup_done):
+    server_base = form.get('host', '').rstrip("/")
+    node_name = form.get('name')
+    otp_code = form.get('otp', '').upper()
+    artnet_ip = form.get('artnet_ip')
+
+    # Vor dem OTP-Request prüfen, sonst ist der Code verbraucht
+    try:
+        universe_ids = parse_universes(form.get('universes', ''))
+    except ValueError as e:
+        return f"<h1>❌ Fehler</h1><p>Ungültige Universen: {e}</p>"
 
     mac_address = get_mac_address()
     register_url = f"{server_base}/api/dmx/otp-authenticate"
 
     logger.info(f"Registrierung bei {register_url} mit MAC {mac_address}...")
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            payload = {
-                "otp": otp_code,
-                "mac_adress": mac_address,
-                "name": node_name
+    try:
+        payload = {
+            "otp": otp_code,
+            "mac_adress": mac_address,
+            "name": node_name
+        }
+
+        status, body = await asyncio.to_thread(post_json, register_url, payload)
+        if status == 200:
+            result = orjson.loads(body)
+            device_secret = result.get('device_secret')
+
+            if not device_secret:
+                return "<h1>❌ Fehler</h1><p>Kein device_secret erhalten.</p>"
+
+            new_config = {
+                "server_url": server_base,
+                "node_name": node_name,
+                "device_secret": device_secret,
+                "artnet_ip": artnet_ip,
+                "mac_address": mac_address,
+                "universes": universe_ids
             }
 
-            async with session.post(register_url, json=payload) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    device_secret = result.get('device_secret')
-
-                    if not device_secret:
-                        return web.Response(text="<h1>❌ Fehler</h1><p>Kein device_secret erhalten.</p>")
-
-                    new_config = {
-                        "server_url": server_base,
-                        "node_name": node_name,
-                        "device_secret": device_secret,
-                        "artnet_ip": artnet_ip,
-                        "mac_address": mac_address
-                    }
-
-                    with open(CONFIG_FILE, "w") as f:
-                        json.dump(new_config, f, indent=2)
-
-                    return web.Response(text="<h1>✅ Erfolg!</h1><p>Node registriert. Neustart...</p>")
-                else:
-                    text = await resp.text()
-                    return web.Response(text=f"<h1>❌ Fehler {resp.status}</h1><p>{text}</p>")
-        except Exception as e:
-            return web.Response(text=f"<h1>❌ Error: {e}</h1>")
+            save_config(new_config)
+            setup_done.set()
+
+            return "<h1>✅ Erfolg!</h1><p>Node registriert. Neustart...</p>"
+        else:
+            text = body.decode(errors="replace")
+            return f"<h1>❌ Fehler {status}</h1><p>{text}</p>"
+    except Exception as e:
+        return f"<h1>❌ Error: {e}</h1>"
+
+
+async def read_http_request(reader):
+    """
+    Liest Request-Line, Header und Body. Gibt (Methode, Pfad, Body) zurück,
+    oder None wenn der Client ohne Request geschlossen hat (idle Verbindung).
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= SETUP_MAX_HEADERS:
+            raise ValueError("Zu viele Header")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    if length > SETUP_MAX_BODY:
+        raise ValueError("Request Body zu groß")
+    body = await reader.readexactly(length) if length else b""
+
+    return method, urllib.parse.urlsplit(target).path, body
+
+
+def write_http_response(writer, status, html):
+    body = html.encode()
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+
+
+async def handle_http(reader, writer, setup_done):
+    try:
+        async with asyncio.timeout(SETUP_READ_TIMEOUT):
+            request = await read_http_request(reader)
+        if request is None:
+            return
+        method, path, body = request
+
+        if method == "GET" and path == "/":
+            write_http_response(writer, HTTPStatus.OK, handle_setup_page())
+        elif method == "POST" and path == "/register":
+            form = {k: v[0] for k, v in urllib.parse.parse_qs(body.decode()).items()}
+            html = await handle_register(form, setup_done)
+            write_http_response(writer, HTTPStatus.OK, html)
+        else:
+            write_http_response(writer, HTTPStatus.NOT_FOUND, "<h1>404 Not Found</h1>")
+        await writer.drain()
+    except (ValueError, TimeoutError, ConnectionError, asyncio.IncompleteReadError) as e:
+        logger.warning(f"Ungültiger Setup-Request: {e}")
+    finally:
+        writer.close()
 
 
 async def run_setup_server():
-    app = web.Application()
-    app.add_routes([web.get('/', handle_setup_page),
-                    web.post('/register', handle_register)])
-    runner = web.AppRunner(app)
-    await runner.setup()
-    site = web.TCPSite(runner, '0.0.0.0', 80)
+    if os.path.exists(CONFIG_FILE):
+        return
+
+    # Wird von handle_register nach erfolgreicher Registrierung gesetzt
+    setup_done = asyncio.Event()
+    server = await asyncio.start_server(
+        functools.partial(handle_http, setup_done=setup_done), '0.0.0.0', 80)
     logger.info("⚠️ SETUP MODUS: http://<PI-IP>/")
-    await site.start()
 
-    while not os.path.exists(CONFIG_FILE):
-        await asyncio.sleep(1)
+    async with server:
+        await setup_done.wait()
 
-    await runner.cleanup()
+        # Offene Verbindungen (z.B. idle Browser-Sockets) sofort schließen, sonst
+        # wartet wait_closed() beim Verlassen bis zum SETUP_READ_TIMEOUT.
+        # Die Erfolgsseite liegt da schon im Transport-Puffer und wird noch gesendet.
+        server.close()
+        server.close_clients()
 
 
 # --- TEIL 2: DMX / ARTNET ENGINE ---
 
+def add_universe_channel(node, universe_channels, u_id):
+    """Legt ein ArtNet Universum mit einem 512er Kanal und dessen Puffern an."""
+    logger.info(f"Registriere ArtNet Universum {u_id}")
+    universe = node.add_universe(u_id)
+    channel = universe.add_channel(
+        start=1, width=512, channel_name=f"Univ-{u_id}")
+    # Feste 512-Byte Puffer pro Universum (aktuell + zuletzt gesendet)
+    universe_channels[u_id] = (channel, bytearray(512), bytearray(512))
+
+
+async def flush_universes(universe_channels, dirty, frame_ready):
+    """
+    Gibt pro Tick nur den jeweils neuesten Frame jedes Universums an pyartnet.
+    Schickt der Server schneller als ARTNET_MAX_FPS, werden Zwischenframes verworfen.
+    Ohne neue Frames schläft die Task auf frame_ready statt zu pollen.
+    """
+    interval = 1 / ARTNET_MAX_FPS
+    while True:
+        await frame_ready.wait()
+        frame_ready.clear()
+        while dirty:
+            channel, buf, prev_buf = universe_channels[dirty.pop()]
+
+            # Unveränderte Frames nicht erneut an pyartnet geben,
+            # refresh_every sendet den Stand ohnehin periodisch
+            if buf != prev_buf:
+                # pyartnet nimmt jede Collection mit len() + Iteration,
+                # der bytearray wird daher ohne list()-Kopie übergeben
+                channel.set_values(buf)
+                prev_buf[:] = buf
+
+        # Höchstens ARTNET_MAX_FPS Flushes pro Sekunde
+        await asyncio.sleep(interval)
+
+
+async def sleep_backoff(backoff):
+    """Wartet backoff plus Jitter und gibt den nächsten (verdoppelten) Backoff zurück."""
+    # Jitter, damit nicht alle Nodes gleichzeitig reconnecten
+    await asyncio.sleep(backoff + random.uniform(0, backoff / 2))
+    return min(backoff * 2, RECONNECT_MAX_DELAY)
+
+
+async def receive_dmx(node, uri, universe_channels, dirty, frame_ready):
+    """Empfängt DMX Frames vom Server und reconnected bei Verbindungsabbruch."""
+    backoff = RECONNECT_MIN_DELAY
+    invalid_universes = set()
+
+    while True:
+        try:
+            # Keepalive-Pings erkennen tote Verbindungen (z.B. NAT-Drop) in Sekunden.
+            # Keine Kompression: DMX-Frames sind klein und kaum komprimierbar.
+            async with websockets.connect(uri,
+                                          ping_interval=20,
+                                          ping_timeout=10,
+                                          max_queue=64,
+                                          compression=None) as websocket:
+                logger.info("🟢 Verbunden! Warte auf DMX Daten...")
+
+                # Level einmal pro Verbindung prüfen statt pro Frame
+                log_frames = logger.isEnabledFor(logging.DEBUG)
+
+                async for message in websocket:
+                    # Daten kommen an -> Backoff zurücksetzen
+                    backoff = RECONNECT_MIN_DELAY
+
+                    # 4. Binary Check (Header > 2 Bytes)
+                    if isinstance(message, bytes) and len(message) > 2:
+
+                        # Zero-Copy Sicht auf den Frame
+                        mv = memoryview(message)
+
+                        # Universum lesen (Big Endian)
+                        u_id = _U16.unpack_from(mv)[0]
+                        payload = mv[2:514]
+                        dmx_len = len(payload)
+                        if log_frames:
+                            logger.debug(f"Empfange {dmx_len} Kanäle für Universum {u_id}")
+
+                        entry = universe_channels.get(u_id)
+                        if entry is None:
+                            if u_id > ARTNET_MAX_UNIVERSE:
+                                if u_id not in invalid_universes:
+                                    logger.warning(f"Ungültiges Universum {u_id} vom Server, ignoriert")
+                                    invalid_universes.add(u_id)
+                                continue
+
+                            # Nicht vorab konfiguriertes Universum
+                            add_universe_channel(node, universe_channels, u_id)
+                            entry = universe_channels[u_id]
+
+                        buf = entry[1]
+
+                        # DMX Werte direkt in den Puffer kopieren, Rest mit 0 auffüllen.
+                        # Gesendet wird gebündelt in flush_universes().
+                        buf[:dmx_len] = payload
+                        if dmx_len < 512:
+                            buf[dmx_len:] = _ZEROS[dmx_len:]
+                        dirty.add(u_id)
+                        frame_ready.set()
+
+                    elif isinstance(message, str):
+                        logger.info(f"Server Info: {message}")
+
+        except websockets.exceptions.ConnectionClosed:
+            logger.warning(f"🔴 Verbindung verloren. Retry in {backoff:.1f}s...")
+        except Exception as e:
+            logger.error(f"Kritischer Fehler: {e}")
+
+        backoff = await sleep_backoff(backoff)
+
+
 async def run_dmx_client(config):
     target_ip = config.get("artnet_ip", "255.255.255.255")
 
@@ -191,57 +498,52 @@ async def run_dmx_client(config):
     logger.info(f"Starte ArtNet Node -> Target: {target_ip} (von {my_ip})")
 
     # 3. FIX: bind_ip entfernt, da pyartnet das hier nicht unterstützt
-    async with ArtNetNode.create(target_ip, port=6454, max_fps=30, refresh_every=1) as node:
+    async with ArtNetNode.create(target_ip, port=6454, max_fps=ARTNET_MAX_FPS, refresh_every=1) as node:
 
         universe_channels = {}
+        dirty = set()
+        frame_ready = asyncio.Event()
+
+        # Bekannte Universen vorab anlegen, damit der Empfangsloop nicht
+        # mitten im Stream pyartnet umkonfigurieren muss
+        for u_id in config.get("universes", []):
+            # Kaputte Einträge überspringen statt den ganzen Client abstürzen zu lassen
+            if not isinstance(u_id, int) or not 0 <= u_id <= ARTNET_MAX_UNIVERSE:
+                logger.warning(f"Ungültiges Universum {u_id!r} in der Konfiguration, übersprungen")
+                continue
+            if u_id in universe_channels:
+                logger.warning(f"Universum {u_id} doppelt in der Konfiguration, übersprungen")
+                continue
+            add_universe_channel(node, universe_channels, u_id)
 
         ws_base = config['server_url'].replace("http://", "ws://")
         uri = f"{ws_base}/dmx?token={config['device_secret']}"
         logger.info(
             f"Verbinde zu Hyperion Core als '{config['node_name']}'...")
 
-        while True:
-            try:
-                async with websockets.connect(uri) as websocket:
-                    logger.info("🟢 Verbunden! Warte auf DMX Daten...")
-
-                    async for message in websocket:
-                        # 4. Binary Check (Header > 2 Bytes)
-                        if isinstance(message, bytes) and len(message) > 2:
-
-                            # Universum lesen (Big Endian)
-                            u_id = int.from_bytes(
-                                message[0:2], byteorder='big')
-                            dmx_len = len(message) - 2
-                            logger.info(f"DEBUG: Empfange {dmx_len} Kanäle für Universum {u_id}")
-                            # --- DEBUGGING END ---
-                            # DMX Werte lesen
-                            dmx_raw = message[2:]
-                            dmx_values = list(dmx_raw)
-
-                            if u_id not in universe_channels:
-                                logger.info(
-                                    f"Registriere ArtNet Universum {u_id}")
-                                universe = node.add_universe(u_id)
-                                channel = universe.add_channel(
-                                    start=1, width=512, channel_name=f"Univ-{u_id}")
-                                universe_channels[u_id] = channel
-
-                            if len(dmx_values) < 512:
-                                dmx_values.extend(
-                                    [0] * (512 - len(dmx_values)))
-
-                            universe_channels[u_id].set_values(dmx_values)
-
-                        elif isinstance(message, str):
-                            logger.info(f"Server Info: {message}")
-
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning("🔴 Verbindung verloren. Retry in 5s...")
-                await asyncio.sleep(5)
-            except Exception as e:
-                logger.error(f"Kritischer Fehler: {e}")
-                await asyncio.sleep(5)
+        # Stirbt eine Task, werden die anderen abgebrochen und der Fehler
+        # landet beim Supervisor
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(flush_universes(universe_channels, dirty, frame_ready))
+            tg.create_task(receive_dmx(node, uri, universe_channels, dirty, frame_ready))
+
+
+async def supervise_dmx_client(config):
+    """Startet run_dmx_client nach unerwarteten Fehlern mit Backoff neu."""
+    backoff = RECONNECT_MIN_DELAY
+    loop = asyncio.get_running_loop()
+
+    while True:
+        started = loop.time()
+        try:
+            await run_dmx_client(config)
+        except Exception:
+            logger.exception("DMX Client abgestürzt, starte neu...")
+
+        # Lief der Client eine Weile stabil, wieder schnell neu starten
+        if loop.time() - started > RECONNECT_MAX_DELAY:
+            backoff = RECONNECT_MIN_DELAY
+        backoff = await sleep_backoff(backoff)
 
 
 # --- MAIN ---
@@ -251,12 +553,27 @@ async def main():
         await run_setup_server()
 
     if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-        await run_dmx_client(config)
+        with open(CONFIG_FILE, "rb") as f:
+            config = orjson.loads(f.read())
+
+        # SIGTERM (z.B. systemd) beendet sauber, damit der ArtNet Node geschlossen wird
+        stop = asyncio.Event()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+        except NotImplementedError:
+            pass  # Windows unterstützt keine Signal-Handler im Event Loop
+
+        async with asyncio.TaskGroup() as tg:
+            dmx_task = tg.create_task(supervise_dmx_client(config))
+            await stop.wait()
+            logger.info("SIGTERM erhalten, fahre herunter...")
+            dmx_task.cancel()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         pass